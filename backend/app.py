@@ -4,13 +4,14 @@ FastAPI Produc# Global managers (following project_structure.md pattern)
 """
 
 import asyncio
-import json
+import os
 import time
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, Request, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
 # Import our managers (following project_structure.md)
@@ -25,7 +26,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Sol Glasses Production Backend",
     description="Clean architecture backend integrating all testing insights",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # C-encoded JSON bodies for REST endpoints
 )
 
 # CORS for React frontend (from our testing)
@@ -35,11 +37,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=7200,  # Cache preflights for 2h (Chromium's cap) instead of the 10 min default
 )
 
 # Global managers (following project_structure.md pattern)
 gaze_manager = GazeDataManager()
 
+# Pre-built SSE frames: the payload is %-formatted into the template in one
+# allocation instead of building a dict/str per frame
+SSE_DATA_FRAME = b"data: %b\n\n"
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the system"""
@@ -86,7 +94,7 @@ async def get_status():
         # System health
         "current_gaze": frontend_data["gaze"]["current"] is not None,
         "aoi_hits": frontend_data["aoi_hits"]["total_hits"],
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 @app.get("/api/gaze/stream")
@@ -97,18 +105,36 @@ async def stream_gaze_data(request: Request):
     """
     
     async def event_stream():
+        # Bound once per connection rather than looked up every tick
+        is_disconnected = request.is_disconnected
+        get_frontend_data = gaze_manager.get_frontend_data
+        dumps, dumps_option = orjson.dumps, orjson.OPT_SERIALIZE_NUMPY
+        last_payload = None
+        idle_ticks = 0
         try:
             while True:
                 # Check if client disconnected
-                if await request.is_disconnected():
+                if await is_disconnected():
                     logger.info("Client disconnected from gaze stream")
                     break
                 
                 # Get current data using our clean architecture
-                data = gaze_manager.get_frontend_data()
+                data = get_frontend_data()
+                payload = dumps(data, option=dumps_option)
                 
-                # Send as Server-Sent Event
-                yield f"data: {json.dumps(data)}\n\n"
+                # Send as Server-Sent Event, skipping frames identical to the
+                # last one sent (e.g. idle before a session); a comment line
+                # keeps the connection alive about once a second meanwhile.
+                # Frames are yielded as bytes so StreamingResponse skips the
+                # str -> UTF-8 encode
+                if payload != last_payload:
+                    yield SSE_DATA_FRAME % payload
+                    last_payload = payload
+                    idle_ticks = 0
+                else:
+                    idle_ticks += 1
+                    if idle_ticks % 20 == 0:
+                        yield SSE_KEEPALIVE_FRAME
                 
                 # 20Hz update rate (from our testing insights)
                 await asyncio.sleep(0.05)
@@ -116,7 +142,7 @@ async def stream_gaze_data(request: Request):
         except asyncio.CancelledError:
             logger.info("SSE stream cancelled")
         except Exception as e:
-            logger.error(f"SSE stream error: {e}")
+            logger.error("SSE stream error: %s", e)
     
     return StreamingResponse(
         event_stream(),
@@ -147,7 +173,7 @@ async def start_session(session_data: dict):
     student_name = session_data.get("studentName", "Unknown Student")
     lesson_title = session_data.get("lessonTitle", "Interactive Reading")
     
-    logger.info(f"=� Starting session: {session_id} for {student_name}")
+    logger.info("=� Starting session: %s for %s", session_id, student_name)
     
     success = gaze_manager.start_streaming_session(session_id)
     
@@ -158,13 +184,13 @@ async def start_session(session_data: dict):
             "student_name": student_name,
             "lesson_title": lesson_title,
             "message": f"Started session for {student_name}",
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
     else:
         return {
             "status": "error", 
             "message": "Failed to start streaming session",
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
 
 @app.post("/api/session/stop")
@@ -178,7 +204,7 @@ async def stop_session(session_data: dict):
     if not session_id:
         return {"status": "error", "message": "Session ID required"}
     
-    logger.info(f"=� Stopping session: {session_id}")
+    logger.info("=� Stopping session: %s", session_id)
     
     # Get final statistics before stopping
     final_stats = gaze_manager.get_session_statistics()
@@ -193,13 +219,13 @@ async def stop_session(session_data: dict):
             "filename": filename,
             "final_statistics": final_stats,
             "message": f"Session data exported to {filename}",
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
     else:
         return {
             "status": "error",
             "message": "Failed to export session data",
-            "timestamp": int(time.time() * 1000)
+            "timestamp": time.time_ns() // 1_000_000
         }
 
 @app.get("/api/session/statistics")
@@ -218,7 +244,7 @@ async def get_aoi_list():
     return {
         "aois": frontend_data["aois"],
         "total_count": len(frontend_data["aois"]),
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 @app.post("/api/aoi/add")
@@ -248,7 +274,7 @@ async def get_recent_aoi_hits():
     return {
         "recent_hits": frontend_data["aoi_hits"]["recent"],
         "total_hits": frontend_data["aoi_hits"]["total_hits"],
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 # ==============================================================================
@@ -262,33 +288,39 @@ async def health_check():
         "status": "healthy",
         "service": "sol_glasses_backend",
         "version": "1.0.0_production",
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 @app.get("/api/performance")
 async def get_performance_metrics():
-    """Get system performance metrics"""
-    frontend_data = gaze_manager.get_frontend_data()
+    """
+    Get system performance metrics
+    Reads the few counters it reports straight from the manager instead of
+    building the full frontend snapshot (trail, hits, achievements, AOIs)
+    """
+    total_samples = gaze_manager.total_samples
+    start_time = gaze_manager.session_start_time
+    duration = time.time() - start_time if start_time else 0
+    current_gaze = gaze_manager.current_gaze
     
     return {
         "gaze_streaming": {
-            "active": frontend_data["gaze"]["is_streaming"],
-            "samples_collected": frontend_data["session"]["total_samples"],
-            "session_duration": frontend_data["session"]["duration"],
-            "samples_per_second": (
-                frontend_data["session"]["total_samples"] / max(frontend_data["session"]["duration"], 1) 
-                if frontend_data["session"]["duration"] > 0 else 0
-            )
+            "active": gaze_manager.is_streaming,
+            "samples_collected": total_samples,
+            "session_duration": duration,
+            "samples_per_second": total_samples / max(duration, 1) if duration > 0 else 0
         },
         "aoi_processing": {
-            "total_hits": frontend_data["aoi_hits"]["total_hits"],
-            "aoi_count": len(frontend_data["aois"])
+            "total_hits": len(gaze_manager.recent_hits),
+            "aoi_count": len(gaze_manager.aoi_collection.elements)
         },
         "system": {
-            "calibrated": frontend_data["calibration"]["calibrated"],
-            "accuracy_px": frontend_data["calibration"]["accuracy_px"]
+            # The manager keeps no calibration report; expose whether the latest
+            # gaze sample carries calibrated coordinates
+            "calibrated": current_gaze is not None and current_gaze.calibrated_x is not None,
+            "accuracy_px": None
         },
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 # ==============================================================================
@@ -302,7 +334,7 @@ async def upload_text_for_mapping(request: Request):
     Supports our LLM-based vocabulary tagging approach
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         text_content = body.get("content", "")
         title = body.get("title", "Untitled")
         vocabulary_tags = body.get("vocabulary_tags", [])
@@ -326,7 +358,7 @@ async def upload_text_for_mapping(request: Request):
             }
             
     except Exception as e:
-        logger.error(f"Text upload error: {e}")
+        logger.error("Text upload error: %s", e)
         return {
             "status": "error", 
             "message": f"Upload failed: {str(e)}"
@@ -368,7 +400,7 @@ async def create_aois_from_coordinates(aoi_data: dict):
         }
         
     except Exception as e:
-        logger.error(f"AOI creation error: {e}")
+        logger.error("AOI creation error: %s", e)
         return {
             "status": "error",
             "message": f"AOI creation failed: {str(e)}"
@@ -398,7 +430,7 @@ async def get_vocabulary_hits():
     return {
         "vocabulary_hits": vocab_hits,
         "total_vocabulary_hits": len(vocab_hits),
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 @app.post("/api/llm/define-vocabulary")
@@ -408,7 +440,7 @@ async def get_vocabulary_definition(request: Request):
     Called when 800ms+ fixation is detected on vocabulary
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         word = body.get("word", "")
         context = body.get("context", "")
         user_profile = body.get("user_profile", {})
@@ -424,15 +456,15 @@ async def get_vocabulary_definition(request: Request):
             "difficulty_explanation": f"This word might be challenging because...",
             "learning_tip": "Memory aid or learning strategy here",
             "synonyms": ["similar", "related", "equivalent"],
-            "response_time": int(time.time() * 1000)
+            "response_time": time.time_ns() // 1_000_000
         }
         
-        logger.info(f"📚 LLM Stage 2: Provided definition for '{word}'")
+        logger.info("📚 LLM Stage 2: Provided definition for '%s'", word)
         
         return definition_response
         
     except Exception as e:
-        logger.error(f"LLM definition error: {e}")
+        logger.error("LLM definition error: %s", e)
         return {
             "error": f"Failed to get definition: {str(e)}"
         }
@@ -460,7 +492,7 @@ async def get_debug_info():
             "Performance optimization (20Hz streaming)"
         ],
         "ready_for_frontend_testing": True,
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
 
 # ==============================================================================
@@ -481,10 +513,17 @@ if __name__ == "__main__":
     print("-" * 60)
     
     # Run the production server
+    # Single worker on purpose: gaze_manager state lives in this process.
+    # loop/http "auto" pick uvloop and httptools from uvicorn[standard] where
+    # available and fall back to asyncio/h11 (e.g. uvloop on Windows)
     uvicorn.run(
         "app:app",
         host="localhost",
         port=8000,
-        log_level="info",
-        reload=False  # Production mode
+        loop="auto",
+        http="auto",
+        ws="none",  # No WebSocket routes; SSE runs over plain HTTP
+        log_level=os.getenv("LOG_LEVEL", "info"),
+        access_log=os.getenv("ACCESS_LOG", "0") == "1",  # Off by default: polling clients hit it many times a second
+        reload=os.getenv("DEV", "0") == "1"  # Production mode unless DEV=1
     )
\ No newline at end of file
@@ -6,16 +6,22 @@ Following project_structure.md guidance: "直接抄進 GazeDataManager"
 
 import sys
 import os
+import socket
 import time
 import threading
-import json
+import numpy as np
+import orjson
+from collections import deque
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import asdict
 
 # Add paths for Sol SDK (exactly like official examples)
+# (each path added once, even if this module is re-imported or reloaded)
 current_dir = os.path.dirname(__file__)
-sys.path.append(os.path.abspath(os.path.join(current_dir, '../..')))
-sys.path.append(os.path.abspath(os.path.join(current_dir, '../../examples')))
+for sdk_path in (os.path.abspath(os.path.join(current_dir, '../..')),
+                 os.path.abspath(os.path.join(current_dir, '../../examples'))):
+    if sdk_path not in sys.path:
+        sys.path.append(sdk_path)
 
 try:
     # DIRECT imports from debug_datacollector.md patterns
@@ -36,6 +42,7 @@ from models.gaze_point import GazePoint
 from models.aoi_element import AOIElement, AOICollection  
 from models.hit_log import HitLog, HitLogManager
 from models.achievement import Achievement, AchievementManager
+from models.cognitive_load import GazeWindowStats
 
 class GazeDataManager:
     """
@@ -43,6 +50,16 @@ class GazeDataManager:
     "把 sample 中的串流初始化、事件 loop、資料欄位 mapping 直接抄進 GazeDataManager"
     """
     
+    # Cognitive load scoring: raw metric -> 0-100 score scale and level thresholds
+    COGNITIVE_DISPERSION_SCALE = 5.0  # Dispersion (px) per score point
+    COGNITIVE_VELOCITY_SCALE = 100.0  # Velocity (px/s) per score point
+    COGNITIVE_DISPERSION_WEIGHT = 0.6
+    COGNITIVE_VELOCITY_WEIGHT = 0.4
+    COGNITIVE_LOW_THRESHOLD = 30
+    COGNITIVE_HIGH_THRESHOLD = 70
+    
+    GLASSES_PROBE_TIMEOUT = 0.5  # Seconds; TCP probe before handing off to the SDK
+    
     def __init__(self):
         # Sol SDK components (EXACTLY like gaze_streaming.py)
         self.sync_client: Optional[SyncClient] = None
@@ -50,8 +67,12 @@ class GazeDataManager:
         self.is_streaming = False
         
         # Data storage (following project structure)
-        self.gaze_trail: List[GazePoint] = []
+        self.gaze_trail: deque = deque(maxlen=20)  # Bounded: oldest sample drops in O(1)
+        self.gaze_window = GazeWindowStats(size=10)  # Running stats for cognitive load
         self.aoi_collection = AOICollection()
+        # Score factors folded once so each cognitive load update only multiplies
+        self._dispersion_factor = self.COGNITIVE_DISPERSION_WEIGHT / self.COGNITIVE_DISPERSION_SCALE
+        self._velocity_factor = self.COGNITIVE_VELOCITY_WEIGHT / self.COGNITIVE_VELOCITY_SCALE
         self.hit_log_manager: Optional[HitLogManager] = None
         self.achievement_manager: Optional[AchievementManager] = None
         
@@ -62,15 +83,16 @@ class GazeDataManager:
         
         # Real-time data for frontend
         self.current_gaze: Optional[GazePoint] = None
-        self.recent_hits: List[HitLog] = []
+        self.recent_hits: deque = deque(maxlen=10)  # Bounded like gaze_trail
         self.current_cognitive_load: Optional[Dict] = None
-        self.cognitive_load_history: List[Dict] = []
+        self.cognitive_load_history: deque = deque(maxlen=20)
         self.vocabulary_discoveries: List[str] = []
+        self._last_hit_aoi_id: Optional[str] = None  # AOI under the previous valid sample
         
         # Text-coordinate mapping support for testing our approach
         self.current_text_content = {}  # {text_id: {"content": "...", "vocabulary_tags": [...]}}
         self.text_aois = {}  # {word_id: {"word": "...", "bbox": [x,y,w,h], "text_id": "..."}}
-        self.vocabulary_hits = []  # Recent vocabulary hits for frontend testing
+        self.vocabulary_hits: deque = deque(maxlen=20)  # Recent vocabulary hits for frontend testing
         
         # Initialize AOIs
         self.aoi_collection.create_standard_lesson_aois()
@@ -89,14 +111,14 @@ class GazeDataManager:
         self.hit_log_manager = HitLogManager(session_id)
         self.achievement_manager = AchievementManager(session_id)  # 新增：成就系統
         self.total_samples = 0
+        self._last_hit_aoi_id = None
         
         if not SOL_SDK_AVAILABLE:
             return self._start_mock_streaming()
         
         try:
-            # EXACT pattern from gaze_streaming.py main()
-            address, port = get_ip_and_port()
-            self.sync_client = SyncClient(address, port)
+            # EXACT pattern from gaze_streaming.py main(), connecting only once
+            self._ensure_client()
             
             # EXACT pattern: create_streaming_thread
             self.streaming_thread = self.sync_client.create_streaming_thread(StreamingMode.GAZE)
@@ -114,6 +136,25 @@ class GazeDataManager:
             print(f"❌ Failed to start streaming: {e}")
             return self._start_mock_streaming()
     
+    def _ensure_client(self) -> 'SyncClient':
+        """
+        Return the shared Sol SDK sync client, connecting on first use only
+        Streaming, camera parameters and tags all reuse this one connection
+        """
+        if self.sync_client is None:
+            address, port = get_ip_and_port()
+            
+            # Quick TCP probe so unreachable glasses fail in GLASSES_PROBE_TIMEOUT
+            # and fall back to mock data, instead of waiting out SDK timeouts
+            try:
+                socket.create_connection((address, int(port)), timeout=self.GLASSES_PROBE_TIMEOUT).close()
+            except OSError as e:
+                raise ConnectionError(f"Sol Glasses unreachable at {address}:{port}: {e}") from e
+            
+            self.sync_client = SyncClient(address, port)
+            print(f"📡 Connected Sol SDK client to {address}:{port}")
+        return self.sync_client
+    
     def _start_gaze_processing_loop(self):
         """
         EXACT extraction from gaze_streaming.py main() function
@@ -121,13 +162,17 @@ class GazeDataManager:
         """
         def gaze_processing_worker():
             try:
+                # Bound once outside the streaming loop
+                get_gazes = self.sync_client.get_gazes_from_streaming
+                process_sample = self._process_gaze_sample_from_sdk
+                
                 while self.is_streaming:
                     # EXACT pattern from gaze_streaming.py line 20-22
-                    gazes = self.sync_client.get_gazes_from_streaming(timeout=5.0)
+                    gazes = get_gazes(timeout=5.0)
                     for gaze in gazes:
                         # EXACT pattern: print(f'gaze: x = {gaze.combined.gaze_2d.x}, y = {gaze.combined.gaze_2d.y}')
                         # But we process instead of just printing
-                        self._process_gaze_sample_from_sdk(gaze)
+                        process_sample(gaze)
                         
             except KeyboardInterrupt:
                 # EXACT pattern from gaze_streaming.py line 23
@@ -150,15 +195,16 @@ class GazeDataManager:
         Based on gaze_streaming.py: gaze.combined.gaze_2d.x, gaze.combined.gaze_2d.y
         """
         # Create GazePoint from exact SDK structure
-        gaze_point = GazePoint.from_sol_sdk(gaze)
-        
+        self._process_gaze_point(GazePoint.from_sol_sdk(gaze))
+    
+    def _process_gaze_point(self, gaze_point: GazePoint):
+        """Process one gaze point (shared by SDK and mock streaming)"""
         # Update current gaze
         self.current_gaze = gaze_point
         
-        # Add to trail
+        # Add to trail (deque maxlen evicts the oldest sample)
         self.gaze_trail.append(gaze_point)
-        if len(self.gaze_trail) > 20:
-            self.gaze_trail.pop(0)
+        self.gaze_window.add(gaze_point.gaze_pos_x, gaze_point.gaze_pos_y, gaze_point.timestamp)
         
         # Update stats
         self.total_samples += 1
@@ -230,16 +276,12 @@ class GazeDataManager:
                 "source": "mock_data"
             }
         
-        # Create sync client for camera intrinsics if not already available
-        sync_client = self.sync_client
-        if not sync_client:
-            try:
-                address, port = get_ip_and_port()
-                sync_client = SyncClient(address, port)
-                print(f"📡 Created temporary Sol SDK connection to {address}:{port}")
-            except Exception as e:
-                print(f"❌ Failed to create Sol SDK connection: {e}")
-                print("⚠️ Sol SDK connection failed, returning mock camera parameters")
+        # Reuse the shared sync client instead of opening a connection per call
+        try:
+            sync_client = self._ensure_client()
+        except Exception as e:
+            print(f"❌ Failed to create Sol SDK connection: {e}")
+            print("⚠️ Sol SDK connection failed, returning mock camera parameters")
             # Return mock parameters for testing homography transformation
             return {
                 "intrinsic": [[800.0, 0.0, 400.0], [0.0, 800.0, 300.0], [0.0, 0.0, 1.0]],
@@ -335,7 +377,7 @@ class GazeDataManager:
         try:
             # EXACT pattern from add_tag.py lines 14-16
             color = TagColor.LightSeaGreen
-            timestamp = int(time.time() * 1000)  # Milliseconds
+            timestamp = time.time_ns() // 1_000_000  # Milliseconds
             tag_name = f"AOI_HIT_{aoi_id}"
             
             req = AddTagRequest(tag_name, description, timestamp, color)
@@ -375,6 +417,11 @@ class GazeDataManager:
         
         hit_aoi = self.aoi_collection.find_hit(hit_x, hit_y)
         
+        # Device tags mark gaze entering an AOI, not every sample dwelling in it
+        hit_aoi_id = hit_aoi.id if hit_aoi else None
+        entered_aoi = hit_aoi_id != self._last_hit_aoi_id
+        self._last_hit_aoi_id = hit_aoi_id
+        
         if hit_aoi and self.hit_log_manager:
             # Create hit log
             hit_log = HitLog.create_from_gaze_and_aoi(
@@ -382,18 +429,17 @@ class GazeDataManager:
             )
             
             self.recent_hits.append(hit_log)
-            if len(self.recent_hits) > 10:
-                self.recent_hits.pop(0)
             
             # For vocabulary words, add tag (following project_structure.md guidance)
             if hit_aoi.vocabulary_word:
                 hit_log.fixation_duration = 1.5
                 self.hit_log_manager.add_hit(hit_log)
                 
-                # Add tag using official add_tag.py pattern
-                self.add_aoi_hit_tag(hit_aoi.id, f"Vocabulary hit: {hit_aoi.text}")
-                
-                print(f"🎯 Vocabulary hit: {hit_aoi.text} at ({hit_x:.1f}, {hit_y:.1f})")
+                # Add tag using official add_tag.py pattern and log the hit,
+                # once per entry rather than for every sample of the dwell
+                if entered_aoi:
+                    self.add_aoi_hit_tag(hit_aoi.id, f"Vocabulary hit: {hit_aoi.text}")
+                    print(f"🎯 Vocabulary hit: {hit_aoi.text} at ({hit_x:.1f}, {hit_y:.1f})")
                 
                 # Add to vocabulary discoveries for SSE
                 if hit_aoi.text not in self.vocabulary_discoveries:
@@ -416,109 +462,89 @@ class GazeDataManager:
         Calculate real-time cognitive load for SSE stream
         Based on gaze dispersion and movement patterns
         """
-        if len(self.gaze_trail) < 5:
+        if self.gaze_window.count < 5:
             return
         
-        # Get recent gaze points for analysis
-        recent_points = self.gaze_trail[-10:] if len(self.gaze_trail) >= 10 else self.gaze_trail
+        # Dispersion and velocity over the last 10 samples, maintained
+        # incrementally as samples arrive (O(1) per update)
+        sample_count = self.gaze_window.count
+        dispersion = self.gaze_window.dispersion()
+        avg_velocity = self.gaze_window.average_velocity()
         
-        # Calculate gaze dispersion
-        x_coords = [p.gaze_pos_x for p in recent_points]
-        y_coords = [p.gaze_pos_y for p in recent_points]
-        
-        x_range = max(x_coords) - min(x_coords) if len(x_coords) > 1 else 0
-        y_range = max(y_coords) - min(y_coords) if len(y_coords) > 1 else 0
-        dispersion = (x_range + y_range) / 2
-        
-        # Calculate movement velocity
-        velocities = []
-        for i in range(1, len(recent_points)):
-            dx = recent_points[i].gaze_pos_x - recent_points[i-1].gaze_pos_x
-            dy = recent_points[i].gaze_pos_y - recent_points[i-1].gaze_pos_y
-            dt = recent_points[i].timestamp - recent_points[i-1].timestamp
-            if dt > 0:
-                velocity = (dx*dx + dy*dy)**0.5 / dt
-                velocities.append(velocity)
-        
-        avg_velocity = sum(velocities) / len(velocities) if velocities else 0
-        
-        # Convert to cognitive load score (0-100)
-        dispersion_score = min(100, dispersion / 5)  # Normalize dispersion
-        velocity_score = min(100, avg_velocity / 100)  # Normalize velocity
-        
-        # Combine scores (higher dispersion + higher velocity = higher cognitive load)
-        cognitive_score = (dispersion_score * 0.6 + velocity_score * 0.4)
+        # Convert to cognitive load score (0-100): weighted, normalized dispersion
+        # and velocity (higher dispersion + higher velocity = higher cognitive load)
+        cognitive_score = (min(100 * self.COGNITIVE_DISPERSION_WEIGHT, dispersion * self._dispersion_factor) +
+                           min(100 * self.COGNITIVE_VELOCITY_WEIGHT, avg_velocity * self._velocity_factor))
         
         # Determine level and color
-        if cognitive_score < 30:
+        if cognitive_score < self.COGNITIVE_LOW_THRESHOLD:
             level, color = "LOW", "green"
-        elif cognitive_score < 70:
+        elif cognitive_score < self.COGNITIVE_HIGH_THRESHOLD:
             level, color = "MEDIUM", "orange"
         else:
             level, color = "HIGH", "red"
         
-        # Update current cognitive load
+        # Update current cognitive load (one clock read shared by this update)
+        now = time.time()
         self.current_cognitive_load = {
             "score": round(cognitive_score, 1),
             "level": level,
             "color": color,
-            "timestamp": time.time(),
+            "timestamp": now,
             "metrics": {
                 "gaze_dispersion": round(dispersion, 2),
                 "avg_velocity": round(avg_velocity, 2),
-                "sample_count": len(recent_points)
+                "sample_count": sample_count
             }
         }
         
-        # Add to history (keep last 20 entries for trend analysis)
-        self.cognitive_load_history.append(self.current_cognitive_load.copy())
-        if len(self.cognitive_load_history) > 20:
-            self.cognitive_load_history.pop(0)
+        # Add to history (deque keeps the last 20 entries for trend analysis).
+        # current_cognitive_load is rebound, never mutated, so no copy is needed
+        self.cognitive_load_history.append(self.current_cognitive_load)
         
         # Update focus achievements based on session duration
         if self.achievement_manager and self.session_start_time:
-            session_duration = time.time() - self.session_start_time
+            session_duration = now - self.session_start_time
             newly_unlocked = self.achievement_manager.update_focus_progress(session_duration)
             for achievement in newly_unlocked:
                 print(f"🏆 Focus achievement unlocked: {achievement.title}")
     
     def _start_mock_streaming(self) -> bool:
         """Mock streaming for testing"""
-        import random
+        # Pre-generate a pool of gaze positions once instead of calling
+        # random.uniform per sample; the worker just cycles through it
+        pool_size = 10000
+        mock_positions = np.random.default_rng().uniform(200, 600, size=(pool_size, 2)).tolist()
         
         def mock_worker():
+            # Loop invariants bound once
+            process_point = self._process_gaze_point
+            create_mock = GazePoint.create_mock
+            sleep = time.sleep
+            clock = time.perf_counter
+            interval = 1.0 / 60.0
+            index = 0
+            # Pace against a monotonic deadline so processing time doesn't
+            # stretch each tick and pull the mock rate below 60 Hz
+            next_tick = clock()
             while self.is_streaming:
                 try:
-                    # Create mock gaze that matches SDK structure
-                    mock_gaze = type('MockGaze', (), {
-                        'combined': type('Combined', (), {
-                            'gaze_2d': type('Gaze2D', (), {
-                                'x': 400 + random.uniform(-200, 200),
-                                'y': 400 + random.uniform(-200, 200),
-                                'valid': 1
-                            })(),
-                            'gaze_3d': type('Gaze3D', (), {
-                                'position': type('Position', (), {
-                                    'x': random.uniform(-50, 50),
-                                    'y': random.uniform(-50, 50),
-                                    'z': 100.0
-                                })(),
-                                'direction': type('Direction', (), {
-                                    'x': 0.0, 'y': 0.0, 'z': -1.0
-                                })(),
-                                'valid': 1
-                            })()
-                        })(),
-                        'left': type('Left', (), {'pupil_size': 3.5})(),
-                        'right': type('Right', (), {'pupil_size': 3.5})()
-                    })()
+                    x, y = mock_positions[index]
+                    index = (index + 1) % pool_size
+                    
+                    process_point(create_mock(x, y))
                     
-                    self._process_gaze_sample_from_sdk(mock_gaze)
-                    time.sleep(1.0 / 60.0)
+                    next_tick += interval
+                    delay = next_tick - clock()
+                    if delay > 0:
+                        sleep(delay)
+                    else:
+                        next_tick = clock()  # Fell behind: resync rather than burst
                     
                 except Exception as e:
                     print(f"Mock streaming error: {e}")
                     time.sleep(0.1)
+                    next_tick = clock()
         
         self.is_streaming = True
         mock_thread = threading.Thread(target=mock_worker, daemon=True)
@@ -553,8 +579,9 @@ class GazeDataManager:
             os.makedirs(os.path.dirname(filename), exist_ok=True)
             
             try:
-                with open(filename, 'w') as f:
-                    json.dump(session_data, f, indent=2, ensure_ascii=False)
+                # orjson encodes straight to UTF-8 bytes in C (same indent=2 layout)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
                 print(f"💾 Session exported: {filename}")
                 return filename
             except Exception as e:
@@ -571,7 +598,9 @@ class GazeDataManager:
             "start_time": self.session_start_time,
             "end_time": time.time(),
             "duration_seconds": duration,
-            "gaze_trail": [gaze.to_dict() for gaze in self.gaze_trail],
+            # list() copies the deque in C before the Python-level to_dict calls,
+            # so a concurrent append from the worker can't break the iteration
+            "gaze_trail": [gaze.to_dict() for gaze in list(self.gaze_trail)],
             "total_samples": self.total_samples,
             "samples_per_second": self.total_samples / max(duration, 1),
             "aois": self.aoi_collection.to_frontend_format(),
@@ -586,18 +615,20 @@ class GazeDataManager:
         return {
             "gaze": {
                 "current": self.current_gaze.to_frontend_format() if self.current_gaze else None,
-                "trail": [gaze.to_frontend_format() for gaze in self.gaze_trail[-5:]],
+                # Copy the deque first (one C call, no GIL switch mid-read): the
+                # streaming worker appends concurrently
+                "trail": [gaze.to_frontend_format() for gaze in list(self.gaze_trail)[-5:]],
                 "is_streaming": self.is_streaming
             },
             "aoi_hits": {
-                "recent": [hit.to_frontend_format() for hit in self.recent_hits[-3:]],
+                "recent": [hit.to_frontend_format() for hit in list(self.recent_hits)[-3:]],  # Copy first, as for the trail
                 "total_hits": len(self.recent_hits),
                 "vocabulary_discoveries": self.vocabulary_discoveries.copy()  # 新增：單字發現列表
             },
             # 新增：即時認知負荷資料
             "cognitive_load": {
                 "current": self.current_cognitive_load,
-                "history": self.cognitive_load_history[-10:] if self.cognitive_load_history else []  # Last 10 for trend
+                "history": list(self.cognitive_load_history)[-10:]  # Last 10 for trend (copy first)
             },
             # 新增：成就系統資料（following your decision: 後端統一維護與存檔）
             "achievements": self.achievement_manager.to_frontend_format() if self.achievement_manager else {
@@ -703,7 +734,7 @@ class GazeDataManager:
             vocab_hit = {
                 "word": word,
                 "word_id": word_id,
-                "timestamp": int(time.time() * 1000),
+                "timestamp": time.time_ns() // 1_000_000,
                 "gaze_x": gaze_point.x,
                 "gaze_y": gaze_point.y,
                 "confidence": gaze_point.confidence,
@@ -712,13 +743,9 @@ class GazeDataManager:
                 "triggered_definition": True  # Flag for LLM Stage 2 call
             }
             
-            # Add to vocabulary hits for frontend consumption
+            # Add to vocabulary hits for frontend consumption (deque keeps the last 20)
             self.vocabulary_hits.append(vocab_hit)
             
-            # Keep only recent hits (last 20)
-            if len(self.vocabulary_hits) > 20:
-                self.vocabulary_hits = self.vocabulary_hits[-20:]
-            
             # Add to vocabulary discoveries
             if word not in self.vocabulary_discoveries:
                 self.vocabulary_discoveries.append(word)
@@ -733,7 +760,7 @@ class GazeDataManager:
         Get recent vocabulary hits for frontend text-coordinate mapping testing
         This is used by /api/text/vocabulary-hits endpoint
         """
-        return self.vocabulary_hits.copy()
+        return list(self.vocabulary_hits)
     
     def clear_text_mapping_data(self):
         """
@@ -7,7 +7,7 @@ from .gaze_point import GazePoint
 from .aoi_element import AOIElement, AOICollection
 from .hit_log import HitLog, HitLogManager  
 
-from .cognitive_load import CognitiveLoad
+from .cognitive_load import CognitiveLoad, GazeWindowStats
 from .achievement import Achievement, AchievementManager
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     'HitLogManager',
     'CalibrationSample', 
     'CognitiveLoad',
+    'GazeWindowStats',
     'Achievement',
     'AchievementManager'
 ]
\ No newline at end of file
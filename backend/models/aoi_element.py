@@ -5,7 +5,8 @@ Based on frontend integration testing and vocabulary discovery insights
 """
 
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+import math
 import time
 
 @dataclass
@@ -198,10 +199,27 @@ class AOICollection:
     Based on lessons learned from vocabulary discovery testing
     """
     
+    GRID_CELL_SIZE = 32  # Hit-test grid cell size in pixels
+    GRID_MAX_CELLS_PER_AOI = 4096  # Larger AOIs are checked outside the grid
+    
     def __init__(self):
         self.elements: Dict[str, AOIElement] = {}
         self.vocabulary_words: List[AOIElement] = []
         self.content_areas: List[AOIElement] = []
+        
+        # Hit-test index, rebuilt lazily on the next lookup after AOIs change:
+        # uniform grid of GRID_CELL_SIZE px cells -> AOIs overlapping the cell,
+        # stored as (priority_position, x0, y0, x1, y1, aoi) in hit-priority
+        # order so the probe compares precomputed bounds
+        self._grid: Dict[Tuple[int, int], List[tuple]] = {}
+        self._oversized: List[tuple] = []  # Too large to bucket
+        # Cells entirely inside their highest-priority AOI: every point in the
+        # cell hits that AOI, so fixations there skip the bounds tests
+        self._cell_owner: Dict[Tuple[int, int], AOIElement] = {}
+        self._index_dirty = True
+        
+        # Frontend AOI list, built once per change instead of on every SSE tick
+        self._frontend_cache: Optional[List[dict]] = None
     
     def add_element(self, aoi: AOIElement) -> None:
         """Add AOI element to collection"""
@@ -211,6 +229,8 @@ class AOICollection:
             self.vocabulary_words.append(aoi)
         else:
             self.content_areas.append(aoi)
+        self._index_dirty = True
+        self._frontend_cache = None
     
     def remove_element(self, aoi_id: str) -> Optional[AOIElement]:
         """Remove AOI element by ID"""
@@ -222,10 +242,58 @@ class AOICollection:
                 self.vocabulary_words.remove(removed)
             if removed in self.content_areas:
                 self.content_areas.remove(removed)
+            self._index_dirty = True
+            self._frontend_cache = None
                 
             return removed
         return None
     
+    def _rebuild_index(self) -> None:
+        """
+        Rebuild the uniform-grid hit-test index
+        Positions follow hit priority: vocabulary words first, then content areas
+        """
+        # Clear the flag before snapshotting the AOI lists: an add/remove on
+        # another thread during the rebuild sets it again and forces a new one
+        self._index_dirty = False
+        cell = self.GRID_CELL_SIZE
+        grid: Dict[Tuple[int, int], List[tuple]] = {}
+        oversized: List[tuple] = []
+        
+        for position, aoi in enumerate(self.vocabulary_words + self.content_areas):
+            x0, y0 = aoi.x, aoi.y
+            x1, y1 = aoi.x + aoi.width, aoi.y + aoi.height
+            entry = (position, x0, y0, x1, y1, aoi)
+            try:
+                col_start, col_end = int(x0 // cell), int(x1 // cell)
+                row_start, row_end = int(y0 // cell), int(y1 // cell)
+            except (OverflowError, ValueError):  # inf/nan bounds
+                oversized.append(entry)
+                continue
+            
+            if (col_end - col_start + 1) * (row_end - row_start + 1) > self.GRID_MAX_CELLS_PER_AOI:
+                oversized.append(entry)
+                continue
+            
+            for col in range(col_start, col_end + 1):
+                for row in range(row_start, row_end + 1):
+                    grid.setdefault((col, row), []).append(entry)
+        
+        # Memoize cells owned outright by their first candidate, unless an
+        # oversized AOI could outrank it
+        first_oversized = oversized[0][0] if oversized else math.inf
+        cell_owner: Dict[Tuple[int, int], AOIElement] = {}
+        for (col, row), candidates in grid.items():
+            position, x0, y0, x1, y1, aoi = candidates[0]
+            if (position < first_oversized and
+                    x0 <= col * cell and (col + 1) * cell <= x1 and
+                    y0 <= row * cell and (row + 1) * cell <= y1):
+                cell_owner[(col, row)] = aoi
+        
+        self._grid = grid
+        self._oversized = oversized
+        self._cell_owner = cell_owner
+    
     def find_hit(self, x: float, y: float) -> Optional[AOIElement]:
         """
         Find which AOI element (if any) contains the given point
@@ -237,17 +305,34 @@ class AOICollection:
         Returns:
             AOIElement that contains the point, or None
         """
-        # Prioritize vocabulary words for hit detection
-        for aoi in self.vocabulary_words:
-            if aoi.contains_point(x, y):
-                return aoi
+        if self._index_dirty:
+            self._rebuild_index()
         
-        # Check content areas
-        for aoi in self.content_areas:
-            if aoi.contains_point(x, y):
-                return aoi
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return None
         
-        return None
+        cell = self.GRID_CELL_SIZE
+        key = (int(x // cell), int(y // cell))
+        owner = self._cell_owner.get(key)
+        if owner is not None:
+            return owner
+        
+        # O(1) cell lookup, then test the few AOIs overlapping that cell
+        # (candidates are in priority order, so the first match wins)
+        best = None
+        for position, x0, y0, x1, y1, aoi in self._grid.get(key, ()):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                best = (position, aoi)
+                break
+        
+        for position, x0, y0, x1, y1, aoi in self._oversized:
+            if best is not None and position > best[0]:
+                break
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                best = (position, aoi)
+                break
+        
+        return best[1] if best else None
     
     def get_vocabulary_words(self) -> List[AOIElement]:
         """Get all vocabulary word AOIs"""
@@ -258,8 +343,13 @@ class AOICollection:
         return self.content_areas.copy()
     
     def to_frontend_format(self) -> List[dict]:
-        """Convert entire collection to frontend format"""
-        return [aoi.to_frontend_format() for aoi in self.elements.values()]
+        """
+        Convert entire collection to frontend format
+        The list is cached until AOIs change; callers must treat it as read-only
+        """
+        if self._frontend_cache is None:
+            self._frontend_cache = [aoi.to_frontend_format() for aoi in self.elements.values()]
+        return self._frontend_cache
     
     def create_standard_lesson_aois(self, center_x: float = 756, center_y: float = 491) -> None:
         """
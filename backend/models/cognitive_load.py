@@ -4,6 +4,7 @@ Cognitive Load data model
 For tracking cognitive load metrics during sessions
 """
 
+from collections import deque
 from dataclasses import dataclass
 import time
 
@@ -44,7 +45,7 @@ class CognitiveLoad:
             return cls(score=0.0, level="LOW", color="green")
         
         # Simple cognitive load based on gaze dispersion
-        recent_points = gaze_trail[-10:]  # Last 10 points
+        recent_points = list(gaze_trail)[-10:]  # Last 10 points (accepts list or deque)
         x_coords = [p.gaze_pos_x for p in recent_points]
         y_coords = [p.gaze_pos_y for p in recent_points]
         
@@ -76,4 +77,86 @@ class CognitiveLoad:
             "avg_fixation_duration": self.avg_fixation_duration,
             "saccade_velocity": self.saccade_velocity,
             "pupil_dilation": self.pupil_dilation
-        }
\ No newline at end of file
+        }
+
+
+class GazeWindowStats:
+    """
+    Sliding window over the most recent gaze samples
+    Keeps x/y min/max in monotonic deques and a running velocity sum,
+    so each new sample and each read is O(1) amortized
+    """
+    
+    def __init__(self, size: int = 10):
+        self.size = size
+        self.count = 0  # Samples currently in the window
+        self._next_index = 0
+        self._previous = None  # (x, y, timestamp) of the last sample
+        
+        # Monotonic deques of (sample_index, value)
+        self._x_min = deque()
+        self._x_max = deque()
+        self._y_min = deque()
+        self._y_max = deque()
+        
+        # (sample_index, velocity) for each step with a positive time delta
+        self._velocities = deque()
+        self._velocity_sum = 0.0
+    
+    @staticmethod
+    def _push(window: deque, index: int, value: float, keep_smaller: bool) -> None:
+        """Push a value, dropping entries it dominates from the back"""
+        if keep_smaller:
+            while window and window[-1][1] >= value:
+                window.pop()
+        else:
+            while window and window[-1][1] <= value:
+                window.pop()
+        window.append((index, value))
+    
+    def add(self, x: float, y: float, timestamp: float) -> None:
+        """Add a gaze sample and evict the one leaving the window"""
+        index = self._next_index
+        self._next_index += 1
+        
+        self._push(self._x_min, index, x, True)
+        self._push(self._x_max, index, x, False)
+        self._push(self._y_min, index, y, True)
+        self._push(self._y_max, index, y, False)
+        
+        if self._previous is not None:
+            prev_x, prev_y, prev_timestamp = self._previous
+            dt = timestamp - prev_timestamp
+            if dt > 0:
+                dx = x - prev_x
+                dy = y - prev_y
+                velocity = (dx*dx + dy*dy)**0.5 / dt
+                self._velocities.append((index, velocity))
+                self._velocity_sum += velocity
+        self._previous = (x, y, timestamp)
+        
+        self.count = min(self.count + 1, self.size)
+        
+        # Evict samples (and the steps leading into them) that left the window
+        oldest = self._next_index - self.size
+        for window in (self._x_min, self._x_max, self._y_min, self._y_max):
+            while window[0][0] < oldest:
+                window.popleft()
+        while self._velocities and self._velocities[0][0] <= oldest:
+            self._velocity_sum -= self._velocities.popleft()[1]
+        if not self._velocities:
+            self._velocity_sum = 0.0  # Drop accumulated float error
+    
+    def dispersion(self) -> float:
+        """Average of the x and y ranges over the window"""
+        if not self.count:
+            return 0.0
+        x_range = self._x_max[0][1] - self._x_min[0][1]
+        y_range = self._y_max[0][1] - self._y_min[0][1]
+        return (x_range + y_range) / 2
+    
+    def average_velocity(self) -> float:
+        """Mean gaze velocity (px/s) over the steps in the window"""
+        if not self._velocities:
+            return 0
+        return self._velocity_sum / len(self._velocities)
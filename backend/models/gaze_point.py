@@ -8,11 +8,20 @@ from dataclasses import dataclass, asdict
 from typing import Optional
 import time
 
-@dataclass
+try:
+    # Imported once here rather than inside the per-sample homography path
+    import numpy as np
+except ImportError:
+    np = None
+
+@dataclass(slots=True)
 class GazePoint:
     """
     Comprehensive gaze data structure supporting both 2D and 3D gaze tracking
     Based on Sol Glasses SDK and frontend integration testing
+
+    Declared with slots: one instance is created per streamed sample, so
+    dropping the per-instance __dict__ cuts allocation and attribute cost
     """
     # Timestamp
     timestamp: float  # Unix timestamp in seconds (with millisecond precision)
@@ -140,9 +149,11 @@ class GazePoint:
         Apply homography transformation for accurate perspective correction
         This fixes the 500px+ errors caused by linear scaling
         """
+        if np is None:
+            self._apply_linear_transform(transform)
+            return
+        
         try:
-            import numpy as np
-            
             # Get homography matrix from transform
             H = np.array(transform["homography_matrix"], dtype=np.float64)
             
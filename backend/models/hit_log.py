@@ -8,11 +8,14 @@ from dataclasses import dataclass, asdict
 from typing import Optional, List, Dict, Any
 import time
 
-@dataclass
+@dataclass(slots=True)
 class HitLog:
     """
     Records when gaze hits an Area of Interest (AOI)
     Based on frontend integration testing and vocabulary discovery insights
+
+    Declared with slots: a log is created for every sample that lands on an
+    AOI, so it follows GazePoint in dropping the per-instance __dict__
     """
     # Basic Hit Information
     gaze_timestamp: float  # When the gaze hit occurred (Unix timestamp)
@@ -85,9 +88,13 @@ class HitLog:
         Returns:
             Distance in pixels
         """
+        return self._squared_distance_from_center() ** 0.5
+    
+    def _squared_distance_from_center(self) -> float:
+        """Squared pixel distance to the AOI center (for threshold checks without sqrt)"""
         dx = self.gaze_x - self.aoi_center_x
         dy = self.gaze_y - self.aoi_center_y
-        return (dx * dx + dy * dy) ** 0.5
+        return dx * dx + dy * dy
     
     def is_precise_hit(self, threshold: float = 20.0) -> bool:
         """
@@ -99,7 +106,7 @@ class HitLog:
         Returns:
             True if hit was within threshold distance of center
         """
-        return self.calculate_distance_from_center() <= threshold
+        return self._squared_distance_from_center() <= threshold * threshold
     
     def is_long_fixation(self, threshold: float = 1.5) -> bool:
         """
@@ -120,18 +127,19 @@ class HitLog:
         Returns:
             Quality rating: "excellent", "good", "fair", "poor"
         """
-        distance = self.calculate_distance_from_center()
+        # Compare squared distances against squared thresholds (15, 25, 40 px)
+        distance_sq = self._squared_distance_from_center()
         
         if (self.confidence >= 0.8 and 
-            distance <= 15.0 and 
+            distance_sq <= 225.0 and 
             self.fixation_duration >= 1.0):
             return "excellent"
         elif (self.confidence >= 0.6 and 
-              distance <= 25.0 and 
+              distance_sq <= 625.0 and 
               self.fixation_duration >= 0.5):
             return "good"
         elif (self.confidence >= 0.4 and 
-              distance <= 40.0):
+              distance_sq <= 1600.0):
             return "fair"
         else:
             return "poor"
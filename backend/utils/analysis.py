@@ -66,34 +66,29 @@ def analyze_gaze_patterns(gaze_trail: List[Dict]) -> Dict[str, Any]:
     if len(gaze_trail) < 2:
         return {}
     
-    # Extract coordinates
-    x_coords = [g.get("gaze_pos_x", 0) for g in gaze_trail]
-    y_coords = [g.get("gaze_pos_y", 0) for g in gaze_trail]
-    timestamps = [g.get("timestamp", 0) for g in gaze_trail]
+    # Extract coordinates as columnar arrays (one per field)
+    n = len(gaze_trail)
+    x_coords = np.fromiter((g.get("gaze_pos_x", 0) for g in gaze_trail), dtype=np.float64, count=n)
+    y_coords = np.fromiter((g.get("gaze_pos_y", 0) for g in gaze_trail), dtype=np.float64, count=n)
+    timestamps = np.fromiter((g.get("timestamp", 0) for g in gaze_trail), dtype=np.float64, count=n)
     
-    # Calculate velocities
-    velocities = []
-    for i in range(1, len(gaze_trail)):
-        dx = x_coords[i] - x_coords[i-1]
-        dy = y_coords[i] - y_coords[i-1]
-        dt = timestamps[i] - timestamps[i-1]
-        
-        if dt > 0:
-            velocity = np.sqrt(dx*dx + dy*dy) / dt
-            velocities.append(velocity)
+    # Calculate velocities in one vectorized pass
+    dt = np.diff(timestamps)
+    forward = dt > 0
+    velocities = np.hypot(np.diff(x_coords)[forward], np.diff(y_coords)[forward]) / dt[forward]
     
     return {
-        "total_samples": len(gaze_trail),
-        "duration_seconds": timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0,
+        "total_samples": n,
+        "duration_seconds": float(timestamps[-1] - timestamps[0]),
         "gaze_range": {
-            "x_min": min(x_coords),
-            "x_max": max(x_coords), 
-            "y_min": min(y_coords),
-            "y_max": max(y_coords)
+            "x_min": float(x_coords.min()),
+            "x_max": float(x_coords.max()), 
+            "y_min": float(y_coords.min()),
+            "y_max": float(y_coords.max())
         },
         "velocities": {
-            "mean": np.mean(velocities) if velocities else 0,
-            "max": np.max(velocities) if velocities else 0,
-            "std": np.std(velocities) if velocities else 0
+            "mean": float(velocities.mean()) if velocities.size else 0,
+            "max": float(velocities.max()) if velocities.size else 0,
+            "std": float(velocities.std()) if velocities.size else 0
         }
     }
\ No newline at end of file
@@ -4,7 +4,7 @@ Export utilities for session data analysis
 Following project_structure.md guidance for data export
 """
 
-import json
+import orjson
 import os
 import time
 import pandas as pd
@@ -31,7 +31,7 @@ def export_session(manager, session_id: str, output_dir: str = "data") -> str:
     session_data = {
         "session_id": session_id,
         "export_timestamp": time.time(),
-        "gaze_trail": [asdict(g) for g in manager.gaze_trail],
+        "gaze_trail": [asdict(g) for g in list(manager.gaze_trail)],  # Copy: worker appends concurrently
         "aois": {k: asdict(v) for k, v in manager.aoi_collection.elements.items()},
         "hit_log": [asdict(h) for h in manager.hit_log_manager.hits] if manager.hit_log_manager else [],
         "performance": manager.performance_stats,
@@ -42,9 +42,9 @@ def export_session(manager, session_id: str, output_dir: str = "data") -> str:
     timestamp = int(time.time())
     filename = os.path.join(output_dir, f"{session_id}_{timestamp}.json")
     
-    # Export to JSON
-    with open(filename, 'w') as f:
-        json.dump(session_data, f, ensure_ascii=False, indent=2)
+    # Export to JSON (orjson writes UTF-8 bytes directly)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     return filename
 